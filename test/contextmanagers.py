@@ -13,14 +13,18 @@
 """Context managers for using with IBMQProvider unit tests."""
 
 import os
+from io import StringIO
 from typing import Optional, Dict
+from configparser import ConfigParser
 from contextlib import ContextDecorator, contextmanager
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, gettempdir
 from unittest.mock import patch
 
 from qiskit_ibm.credentials import configrc, Credentials
 from qiskit_ibm.credentials.environ import VARIABLES_MAP
-from qiskit_ibm import IBMQFactory
+from qiskit_ibm import IBMQFactory, ibmqfactory
+
+from .fake_account_client import FakeAuthClient
 
 CREDENTIAL_ENV_VARS = VARIABLES_MAP.keys()
 
@@ -72,26 +76,68 @@ class no_envs(ContextDecorator):
 
 
 class custom_qiskitrc(ContextDecorator):
-    """Context manager that uses a temporary qiskitrc."""
+    """Context manager that uses a temporary qiskitrc.
+
+    If ``in_memory`` is ``True``, the qiskitrc contents are kept in the
+    ``buffer`` attribute (an ``io.StringIO``) instead of a temporary file,
+    avoiding disk access altogether.
+    """
     # pylint: disable=invalid-name
 
-    def __init__(self, contents=b''):
-        # Create a temporary file with the contents.
-        self.tmp_file = NamedTemporaryFile()
-        self.tmp_file.write(contents)
-        self.tmp_file.flush()
+    def __init__(self, contents=b'', in_memory=False):
         self.default_qiskitrc_file_original = configrc.DEFAULT_QISKITRC_FILE
+        self.patchers = []
+        if in_memory:
+            self.tmp_file = None
+            self.buffer = StringIO(contents.decode())
+            self.filename = os.path.join(gettempdir(), 'qiskitrc')
+            self.patchers = [
+                patch.object(configrc, 'open', self._open_buffer, create=True),
+                patch.object(configrc, 'ConfigParser', self._buffer_config_parser())
+            ]
+        else:
+            # Create a temporary file with the contents.
+            self.tmp_file = NamedTemporaryFile()
+            self.tmp_file.write(contents)
+            self.tmp_file.flush()
+            self.buffer = None
+            self.filename = self.tmp_file.name
 
     def __enter__(self):
         # Temporarily modify the default location of the qiskitrc file.
-        configrc.DEFAULT_QISKITRC_FILE = self.tmp_file.name
+        configrc.DEFAULT_QISKITRC_FILE = self.filename
+        for patcher in self.patchers:
+            patcher.start()
         return self
 
     def __exit__(self, *exc):
         # Delete the temporary file and restore the default location.
-        self.tmp_file.close()
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        if self.tmp_file:
+            self.tmp_file.close()
         configrc.DEFAULT_QISKITRC_FILE = self.default_qiskitrc_file_original
 
+    @contextmanager
+    def _open_buffer(self, *_args, **_kwargs):
+        """Replacement for ``open()`` that writes to the in-memory buffer."""
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        yield self.buffer
+
+    def _buffer_config_parser(self):
+        """Return a ``ConfigParser`` subclass that reads from the in-memory buffer."""
+        buffer = self.buffer
+
+        class _BufferConfigParser(ConfigParser):
+            """``ConfigParser`` that reads the in-memory buffer instead of a file."""
+
+            def read(self, filenames, encoding=None):
+                self.read_string(buffer.getvalue())
+                return [filenames]
+
+        return _BufferConfigParser
+
 
 class no_file(ContextDecorator):
     """Context manager that disallows access to a file."""
@@ -140,3 +186,16 @@ def mock_ibmq_provider():
     yield
     patcher2.stop()
     patcher.stop()
+
+
+@contextmanager
+def mock_ibmq_auth():
+    """Mock the authentication done by ``IBMQFactory``, so it does not query the API.
+
+    Unlike ``mock_ibmq_provider()``, the providers are still built, using
+    the ``AccountClient`` found in ``qiskit_ibm.accountprovider``.
+    """
+    with patch.object(ibmqfactory, 'AuthClient', FakeAuthClient), \
+            patch.object(IBMQFactory, '_check_api_version',
+                         return_value={'new_api': True, 'api-auth': '0.1'}):
+        yield
@@ -328,3 +328,44 @@ class JobTimeoutClient(BaseFakeAccountClient):
             self._fail_count -= 1
             raise UserTimeoutExceededError('Job timed out!')
         return super().job_final_status(job_id, *_args, **_kwargs)
+
+
+class FailingAccountClient:
+    """Fake AccountClient that cannot be instantiated."""
+
+    def __init__(self, *_args, **_kwargs):
+        """FailingAccountClient constructor."""
+        raise Exception('Kaboom!')
+
+
+class BadBackendAccountClient:
+    """Fake AccountClient that returns an invalid backend configuration."""
+
+    def __init__(self, *_args, **_kwargs):
+        """BadBackendAccountClient constructor."""
+        pass
+
+    def list_backends(self, *_args, **_kwargs):
+        """Return the backend configurations."""
+        return [{'backend_name': 'bad_backend'}]
+
+
+class FakeAuthClient:
+    """Fake AuthClient that returns a single hub without querying the API."""
+
+    def __init__(self, *_args, **_kwargs):
+        """FakeAuthClient constructor."""
+        pass
+
+    def current_service_urls(self):
+        """Return the service URLs."""
+        return {'http': 'https://fake.quantum-computing.ibm.com/api',
+                'ws': 'wss://fake.quantum-computing.ibm.com/ws'}
+
+    def user_hubs(self):
+        """Return the hub/group/project the user has access to."""
+        return [{'hub': 'ibm-q', 'group': 'open', 'project': 'main'}]
+
+    def current_access_token(self):
+        """Return the access token."""
+        return 'fake_access_token'
@@ -13,13 +13,13 @@
 """Tests for the IBMQFactory class."""
 
 import os
+from functools import lru_cache
 from unittest import skipIf, mock
 from configparser import ConfigParser
 
 from qiskit_ibm.accountprovider import AccountProvider
 from qiskit_ibm import accountprovider
 from qiskit_ibm.api.exceptions import RequestsApiError
-from qiskit_ibm.api.clients import AccountClient
 from qiskit_ibm.exceptions import (IBMQAccountError, IBMQAccountValueError,
                                    IBMQAccountCredentialsInvalidUrl,
                                    IBMQAccountCredentialsInvalidToken)
@@ -29,13 +29,20 @@ from qiskit_ibm.credentials.hubgroupproject import HubGroupProject
 
 from ..ibmqtestcase import IBMQTestCase
 from ..decorators import requires_qe_access
-from ..contextmanagers import custom_qiskitrc, no_envs, CREDENTIAL_ENV_VARS
+from ..contextmanagers import custom_qiskitrc, no_envs, mock_ibmq_auth, CREDENTIAL_ENV_VARS
+from ..fake_account_client import FailingAccountClient, BadBackendAccountClient
 from ..utils import get_provider
 
 API_URL = 'https://api.quantum-computing.ibm.com/api'
 AUTH_URL = 'https://auth.quantum-computing.ibm.com/api'
 
 
+@lru_cache(maxsize=None)
+def _cached_non_default_provider(qe_token: str, qe_url: str) -> AccountProvider:
+    """Return a non default provider for the account, looking it up only once."""
+    return get_provider(IBMQFactory(), qe_token, qe_url, default=False)
+
+
 class TestIBMQFactoryEnableAccount(IBMQTestCase):
     """Tests for IBMQFactory ``enable_account()``."""
 
@@ -96,7 +103,7 @@ class TestIBMQFactoryEnableAccount(IBMQTestCase):
     @requires_qe_access
     def test_enable_specified_provider(self, qe_token, qe_url):
         """Test enabling an account with a specified provider."""
-        non_default_provider = get_provider(self.factory, qe_token, qe_url, default=False)
+        non_default_provider = _cached_non_default_provider(qe_token, qe_url)
         enabled_provider = self.factory.enable_account(
             token=qe_token, url=qe_url,
             hub=non_default_provider.credentials.hub,
@@ -104,22 +111,20 @@ class TestIBMQFactoryEnableAccount(IBMQTestCase):
             project=non_default_provider.credentials.project)
         self.assertEqual(non_default_provider, enabled_provider)
 
-    @requires_qe_access
-    def test_provider_init_failed(self, qe_token, qe_url):
+    def test_provider_init_failed(self):
         """Test initializing providers failed."""
-        with mock.patch.object(AccountProvider, '__init__',
-                               return_value=Exception('Kaboom!')):
+        with mock_ibmq_auth(), \
+                mock.patch.object(accountprovider, 'AccountClient', FailingAccountClient):
             with self.assertLogs(ibmqfactory.logger, level='WARNING') as log_cm:
-                self.factory.enable_account(qe_token, qe_url)
+                self.factory.enable_account('API_TOKEN', AUTH_URL)
             self.assertIn('Unable to instantiate provider', str(log_cm.output))
 
-    @requires_qe_access
-    def test_discover_backend_failed(self, qe_token, qe_url):
+    def test_discover_backend_failed(self):
         """Test discovering backends failed."""
-        with mock.patch.object(AccountClient, 'list_backends',
-                               return_value=[{'backend_name': 'bad_backend'}]):
+        with mock_ibmq_auth(), \
+                mock.patch.object(accountprovider, 'AccountClient', BadBackendAccountClient):
             with self.assertLogs(accountprovider.logger, level='WARNING') as context_manager:
-                self.factory.enable_account(qe_token, qe_url)
+                self.factory.enable_account('API_TOKEN', AUTH_URL)
         self.assertIn('bad_backend', str(context_manager.output))
 
 
@@ -142,7 +147,7 @@ class TestIBMQFactoryAccounts(IBMQTestCase):
 
     def test_save_account(self):
         """Test saving an account."""
-        with custom_qiskitrc():
+        with custom_qiskitrc(in_memory=True):
             self.factory.save_account(self.token, url=AUTH_URL)
             stored_cred = self.factory.stored_account()
 
@@ -153,14 +158,14 @@ class TestIBMQFactoryAccounts(IBMQTestCase):
         """Test saving an account with a specified provider."""
         default_hgp_to_save = 'default_hub/default_group/default_project'
 
-        with custom_qiskitrc() as custom_qiskitrc_cm:
+        with custom_qiskitrc(in_memory=True) as custom_qiskitrc_cm:
             hgp = HubGroupProject.from_stored_format(default_hgp_to_save)
             self.factory.save_account(token=self.token, url=AUTH_URL,
                                       hub=hgp.hub, group=hgp.group, project=hgp.project)
 
             # Ensure the `default_provider` name was written to the config file.
             config_parser = ConfigParser()
-            config_parser.read(custom_qiskitrc_cm.tmp_file.name)
+            config_parser.read_string(custom_qiskitrc_cm.buffer.getvalue())
 
             for name in config_parser.sections():
                 single_credentials = dict(config_parser.items(name))
@@ -171,19 +176,22 @@ class TestIBMQFactoryAccounts(IBMQTestCase):
         """Test saving an account without specifying all the hub/group/project fields."""
         invalid_hgps_to_save = [HubGroupProject('', 'default_group', ''),
                                 HubGroupProject('default_hub', None, 'default_project')]
-        for invalid_hgp in invalid_hgps_to_save:
-            with self.subTest(invalid_hgp=invalid_hgp), custom_qiskitrc():
-                with self.assertRaises(IBMQAccountValueError) as context_manager:
-                    self.factory.save_account(token=self.token, url=AUTH_URL,
-                                              hub=invalid_hgp.hub,
-                                              group=invalid_hgp.group,
-                                              project=invalid_hgp.project)
-                self.assertIn('The hub, group, and project parameters must all be specified',
-                              str(context_manager.exception))
+        # The error is raised before the file is written, so a single
+        # qiskitrc can be shared by all the cases.
+        with custom_qiskitrc(in_memory=True):
+            for invalid_hgp in invalid_hgps_to_save:
+                with self.subTest(invalid_hgp=invalid_hgp):
+                    with self.assertRaises(IBMQAccountValueError) as context_manager:
+                        self.factory.save_account(token=self.token, url=AUTH_URL,
+                                                  hub=invalid_hgp.hub,
+                                                  group=invalid_hgp.group,
+                                                  project=invalid_hgp.project)
+                    self.assertIn('The hub, group, and project parameters must all be specified',
+                                  str(context_manager.exception))
 
     def test_delete_account(self):
         """Test deleting an account."""
-        with custom_qiskitrc():
+        with custom_qiskitrc(in_memory=True):
             self.factory.save_account(self.token, url=AUTH_URL)
             self.factory.delete_account()
             stored_cred = self.factory.stored_account()
@@ -212,7 +220,7 @@ class TestIBMQFactoryAccounts(IBMQTestCase):
             self.skipTest('Test requires production auth URL')
 
         # Get a non default provider.
-        non_default_provider = get_provider(self.factory, qe_token, qe_url, default=False)
+        non_default_provider = _cached_non_default_provider(qe_token, qe_url)
 
         with custom_qiskitrc(), no_envs(CREDENTIAL_ENV_VARS):
             self.factory.save_account(token=qe_token, url=qe_url,
@@ -221,12 +229,13 @@ class TestIBMQFactoryAccounts(IBMQTestCase):
                                       project=non_default_provider.credentials.project)
             saved_provider = self.factory.load_account()
             if saved_provider != non_default_provider:
-                # Prevent tokens from being logged.
-                saved_provider.credentials.token = None
-                non_default_provider.credentials.token = None
+                # Prevent tokens from being logged. The expected provider is
+                # shared between tests, so its credentials are not modified.
                 self.fail("loaded default provider ({}) != expected ({})".format(
-                    saved_provider.credentials.__dict__,
-                    non_default_provider.credentials.__dict__))
+                    {key: val for key, val in saved_provider.credentials.__dict__.items()
+                     if key != 'token'},
+                    {key: val for key, val in non_default_provider.credentials.__dict__.items()
+                     if key != 'token'}))
 
         self.assertEqual(self.factory._credentials.token, qe_token)
         self.assertEqual(self.factory._credentials.url, qe_url)
@@ -304,17 +313,27 @@ class TestIBMQFactoryAccounts(IBMQTestCase):
 class TestIBMQFactoryProvider(IBMQTestCase):
     """Tests for IBMQFactory provider related methods."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initial class setup."""
+        super().setUpClass()
+        # The tests in this class do not modify the login state, so the
+        # account is enabled only once and shared between them.
+        cls._shared_factory = IBMQFactory()
+        cls._shared_provider = cls._get_provider()
+
+    @classmethod
     @requires_qe_access
-    def _get_provider(self, qe_token=None, qe_url=None):
+    def _get_provider(cls, qe_token=None, qe_url=None):
         """Return default provider."""
-        return self.factory.enable_account(qe_token, qe_url)
+        return cls._shared_factory.enable_account(qe_token, qe_url)
 
     def setUp(self):
         """Initial test setup."""
         super().setUp()
 
-        self.factory = IBMQFactory()
-        self.provider = self._get_provider()
+        self.factory = self._shared_factory
+        self.provider = self._shared_provider
         self.credentials = self.provider.credentials
 
     def test_get_provider(self):
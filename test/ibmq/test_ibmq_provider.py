@@ -13,6 +13,7 @@
 """Tests for the AccountProvider class."""
 
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.test import providers, slow_test
@@ -35,55 +36,66 @@ class TestAccountProvider(IBMQTestCase, providers.ProviderTestCase):
     provider_cls = AccountProvider
     backend_name = 'ibmq_qasm_simulator'
 
-    def setUp(self):
-        """Initial test setup."""
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        """Initial class setup."""
+        super().setUpClass()
+        # The list of backends does not change during the run, so it is
+        # retrieved only once.
+        cls._all_backends = cls._get_provider().backends()
+        cls._sim_backends = [backend for backend in cls._all_backends
+                             if backend.configuration().simulator]
+        cls._real_backends = [backend for backend in cls._all_backends
+                              if not backend.configuration().simulator]
+
         qr = QuantumRegister(1)
         cr = ClassicalRegister(1)
-        self.qc1 = QuantumCircuit(qr, cr, name='circuit0')
-        self.qc1.h(qr[0])
-        self.qc1.measure(qr, cr)
+        cls.qc1 = QuantumCircuit(qr, cr, name='circuit0')
+        cls.qc1.h(qr[0])
+        cls.qc1.measure(qr, cr)
 
+    @classmethod
     @requires_provider
-    def _get_provider(self, provider):
+    def _get_provider(cls, provider):
         """Return an instance of a provider."""
         # pylint: disable=arguments-differ
         return provider
 
     def test_remote_backends_exist_real_device(self):
         """Test if there are remote backends that are devices."""
-        remotes = self.provider.backends(simulator=False)
+        remotes = self._real_backends
         self.assertTrue(remotes)
 
     def test_remote_backends_exist_simulator(self):
         """Test if there are remote backends that are simulators."""
-        remotes = self.provider.backends(simulator=True)
+        remotes = self._sim_backends
         self.assertTrue(remotes)
 
     def test_remote_backends_instantiate_simulators(self):
         """Test if remote backends that are simulators are an ``IBMQSimulator`` instance."""
-        remotes = self.provider.backends(simulator=True)
+        remotes = self._sim_backends
         for backend in remotes:
             with self.subTest(backend=backend):
                 self.assertIsInstance(backend, IBMQSimulator)
 
     def test_remote_backend_status(self):
         """Test backend_status."""
-        remotes = self.provider.backends()
-        for backend in remotes:
-            _ = backend.status()
+        remotes = self._all_backends
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            _ = list(executor.map(lambda backend: backend.status(), remotes))
 
     def test_remote_backend_configuration(self):
         """Test backend configuration."""
-        remotes = self.provider.backends()
+        remotes = self._all_backends
         for backend in remotes:
             _ = backend.configuration()
 
     def test_remote_backend_properties(self):
         """Test backend properties."""
-        remotes = self.provider.backends(simulator=False)
-        for backend in remotes:
-            properties = backend.properties()
+        remotes = self._real_backends
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_properties = list(executor.map(lambda backend: backend.properties(), remotes))
+        for backend, properties in zip(remotes, all_properties):
             if backend.configuration().simulator:
                 self.assertEqual(properties, None)
 
@@ -142,12 +154,15 @@ class TestAccountProvider(IBMQTestCase, providers.ProviderTestCase):
 
     def test_remote_backend_properties_filter_date(self):
         """Test backend properties filtered by date."""
-        backends = self.provider.backends(simulator=False)
+        backends = self._real_backends
 
         datetime_filter = datetime(2019, 2, 1).replace(tzinfo=None)
-        for backend in backends:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(backend.properties, datetime=datetime_filter)
+                       for backend in backends]
+        for backend, future in zip(backends, futures):
             with self.subTest(backend=backend):
-                properties = backend.properties(datetime=datetime_filter)
+                properties = future.result()
                 if isinstance(properties, BackendProperties):
                     last_update_date = properties.last_update_date.replace(tzinfo=None)
                     self.assertLessEqual(last_update_date, datetime_filter)
@@ -156,8 +171,8 @@ class TestAccountProvider(IBMQTestCase, providers.ProviderTestCase):
 
     def test_provider_backends(self):
         """Test provider_backends have correct attributes."""
-        provider_backends = {back for back in dir(self.provider.backend)
-                             if isinstance(getattr(self.provider.backend, back), IBMQBackend)}
+        provider_backends = {name for name, attr in vars(self.provider.backend).items()
+                             if isinstance(attr, IBMQBackend)}
         backends = {back.name().lower() for back in self.provider._backends.values()}
         self.assertEqual(provider_backends, backends)
 